@@ -1,18 +1,151 @@
 #!/usr/bin/env python3
 """Simple script to record audio from microphone and save it as a WAV file."""
 
+from __future__ import annotations
+
 import argparse
+import os
 import sys
 import time
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
+    import numpy as np
     import pyaudio
     import soundfile as sf
-    import numpy as np
-except ImportError as e:
-    print(f"❌ Missing required package: {e}")
-    print("💡 Make sure you've run 'uv sync' to install dependencies")
-    sys.exit(1)
+
+
+def _import_audio_packages() -> None:
+    """Import PortAudio, libsndfile and numpy bindings on first use."""
+    global np, pyaudio, sf
+
+    try:
+        import numpy as np
+        import pyaudio
+        import soundfile as sf
+    except ImportError as e:
+        print(f"❌ Missing required package: {e}")
+        print("💡 Make sure you've run 'uv sync' to install dependencies")
+        sys.exit(1)
+
+
+class PcmRingBuffer:
+    """
+    Lock-free single-producer, single-consumer ring buffer of int16 samples.
+
+    Only the producer (PortAudio's callback thread) advances the write index and
+    only the consumer advances the read index. Each index is rebound after its
+    samples are copied, which is enough ordering under the GIL.
+    """
+
+    def __init__(self, min_capacity: int):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            min_capacity: Minimum number of samples; rounded up to a power of two
+        """
+        capacity = 1 << max(min_capacity - 1, 1).bit_length()
+        self._buf = np.empty(capacity, dtype=np.int16)
+        self._mask = capacity - 1
+        self._write = 0
+        self._read = 0
+
+    def write(self, samples: np.ndarray) -> bool:
+        """
+        Append a block of samples without allocating.
+
+        Args:
+            samples: int16 samples to append
+
+        Returns:
+            False if the block did not fit and was dropped whole
+        """
+        n = samples.size
+        if n > self._buf.size - (self._write - self._read):
+            return False
+
+        start = self._write & self._mask
+        first = min(n, self._buf.size - start)
+        self._buf[start : start + first] = samples[:first]
+        self._buf[: n - first] = samples[first:]
+        self._write += n
+        return True
+
+    def peek(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the buffered samples without copying them.
+
+        Returns:
+            Up to two contiguous views (the second is non-empty on wrap-around);
+            call ``consume`` once they have been used
+        """
+        n = self._write - self._read
+        start = self._read & self._mask
+        first = min(n, self._buf.size - start)
+        return self._buf[start : start + first], self._buf[: n - first]
+
+    def consume(self, n: int) -> None:
+        """Release ``n`` samples previously returned by ``peek``."""
+        self._read += n
+
+
+def _device_period_frames(audio: pyaudio.PyAudio, sample_rate: int) -> int:
+    """
+    Pick a buffer size matching the default input device's low-latency period.
+
+    Args:
+        audio: Initialized PyAudio instance
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Frames per buffer, rounded up to a power of two (1024 if unknown)
+    """
+    try:
+        latency = audio.get_default_input_device_info()["defaultLowInputLatency"]
+    except (OSError, KeyError):
+        return 1024
+
+    frames = int(latency * sample_rate)
+    if frames <= 0:
+        return 1024
+    return 1 << (frames - 1).bit_length()
+
+
+def _pin_capture_cpu() -> None:
+    """
+    Pin the recorder to the CPU named by ``AUDIO_CPU``, if set.
+
+    Threads spawned afterwards (including PortAudio's callback thread) inherit
+    the affinity, so the capture path is never migrated between cores. Best
+    results come from a core isolated on the kernel command line, e.g.
+    ``isolcpus=3 nohz_full=3 rcu_nocbs=3`` with ``AUDIO_CPU=3``.
+    """
+    cpu = os.environ.get("AUDIO_CPU")
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        return
+
+    try:
+        os.sched_setaffinity(0, {int(cpu)})
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Could not pin recording to CPU {cpu}: {e}")
+
+
+def _raise_capture_priority() -> None:
+    """
+    Ask PortAudio and the OS scheduler for low-latency capture, best effort.
+
+    PA_MIN_LATENCY_MSEC must be set before PortAudio initializes. On Linux the
+    SCHED_FIFO policy is inherited by the callback thread PortAudio spawns when
+    the stream opens; it needs CAP_SYS_NICE, so failures are ignored.
+    """
+    os.environ.setdefault("PA_MIN_LATENCY_MSEC", "2")
+
+    if hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        except (OSError, ValueError):
+            pass
 
 
 def record_audio(
@@ -20,7 +153,7 @@ def record_audio(
     duration: float = 5.0,
     sample_rate: int = 48000,
     channels: int = 1,
-    chunk_size: int = 1024,
+    chunk_size: int | None = None,
 ):
     """
     Record audio from microphone and save to file.
@@ -30,46 +163,103 @@ def record_audio(
         duration: Recording duration in seconds
         sample_rate: Sample rate in Hz (default: 48000 for LFM2-Audio)
         channels: Number of audio channels (1 = mono)
-        chunk_size: Audio chunk size for processing
+        chunk_size: Frames per PortAudio buffer (default: the input device's
+            low-latency period, rounded up to a power of two)
     """
+    _import_audio_packages()
+
     print(f"🎤 Recording audio for {duration} seconds...")
     print("💡 Speak now! Recording will start in 1 second...")
     time.sleep(1)
 
     # Initialize PyAudio
+    _pin_capture_cpu()
+    _raise_capture_priority()
     audio = pyaudio.PyAudio()
+    if chunk_size is None:
+        chunk_size = _device_period_frames(audio, sample_rate)
 
     try:
-        # Open audio stream
-        stream = audio.open(
-            format=pyaudio.paInt16,
+        # PortAudio's callback only pushes into a preallocated ring buffer; the
+        # main thread drains it straight into the WAV file every 100 ms, so
+        # memory stays bounded by the ring size regardless of duration
+        total_samples = int(sample_rate * duration) * channels
+        ring = PcmRingBuffer(sample_rate * channels * 2)
+        captured = 0
+        dropped = 0
+        overflows = 0
+
+        # Resolve everything the callback touches once, outside the hot path
+        frombuffer = np.frombuffer
+        int16 = np.int16
+        ring_write = ring.write
+        input_overflow = pyaudio.paInputOverflow
+        complete = (None, pyaudio.paComplete)
+        keep_going = (None, pyaudio.paContinue)
+
+        def on_audio(in_data, frame_count, time_info, status):
+            nonlocal captured, dropped, overflows
+            if status & input_overflow:
+                overflows += 1
+            samples = frombuffer(in_data, dtype=int16)[: total_samples - captured]
+            if not ring_write(samples):
+                dropped += samples.size
+            captured += samples.size
+            return complete if captured >= total_samples else keep_going
+
+        with sf.SoundFile(
+            output_file,
+            mode="w",
+            samplerate=sample_rate,
             channels=channels,
-            rate=sample_rate,
-            input=True,
-            frames_per_buffer=chunk_size,
-        )
+            subtype="PCM_16",
+        ) as wav:
 
-        print("🔴 Recording...")
-        frames = []
+            def drain() -> None:
+                head, tail = ring.peek()
+                n = head.size + tail.size
+                # The ring only holds whole frames, but its wrap-around point
+                # is frame-aligned only when channels divides the capacity; a
+                # frame straddling it is written from a copy of its samples
+                split = head.size - head.size % channels
+                if split:
+                    wav.write(head[:split].reshape(-1, channels))
+                if split < head.size:
+                    missing = channels - (head.size - split)
+                    frame = np.concatenate((head[split:], tail[:missing]))
+                    wav.write(frame.reshape(1, channels))
+                    tail = tail[missing:]
+                if tail.size:
+                    wav.write(tail.reshape(-1, channels))
+                ring.consume(n)
 
-        # Record audio
-        for _ in range(0, int(sample_rate / chunk_size * duration)):
-            data = stream.read(chunk_size)
-            frames.append(data)
+            # Open audio stream
+            stream = audio.open(
+                format=pyaudio.paInt16,
+                channels=channels,
+                rate=sample_rate,
+                input=True,
+                frames_per_buffer=chunk_size,
+                stream_callback=on_audio,
+            )
 
-        print("⏹️  Recording stopped")
+            print("🔴 Recording...")
 
-        # Stop and close stream
-        stream.stop_stream()
-        stream.close()
+            # Record audio
+            while stream.is_active():
+                time.sleep(0.1)
+                drain()
 
-        # Convert frames to numpy array
-        audio_data = np.frombuffer(b"".join(frames), dtype=np.int16)
-        # Normalize to float32 range [-1, 1]
-        audio_data = audio_data.astype(np.float32) / 32768.0
+            # Stop and close stream
+            stream.stop_stream()
+            stream.close()
+            drain()
 
-        # Save to file
-        sf.write(output_file, audio_data, sample_rate, subtype="PCM_16")
+        print("⏹️  Recording stopped")
+        if dropped:
+            print(f"⚠️  Dropped {dropped // channels} frames (ring buffer full)")
+        if overflows:
+            print(f"⚠️  Input overflowed {overflows} times; some audio may be missing")
         print(f"✅ Audio saved to: {output_file}")
 
     except Exception as e:
@@ -1,14 +1,50 @@
 #!/usr/bin/env python3
 """Run the FastAPI server for audio transcription."""
 
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
+    # Under systemd socket activation, serve the pre-opened listening socket
+    # (always fd 3) so restarts never close it. Behind a local reverse proxy,
+    # listen on a Unix domain socket instead of TCP.
+    uds = os.environ.get("AUDIO_API_UDS")
+    if os.environ.get("LISTEN_PID") == str(os.getpid()) and os.environ.get(
+        "LISTEN_FDS"
+    ):
+        bind = {"fd": 3}
+    elif uds:
+        bind = {"uds": uds}
+    else:
+        bind = {"host": "0.0.0.0", "port": 8001}
+
+    # One worker by default. Extra workers each load their own model wrapper
+    # and run up to MAX_CONCURRENT_TRANSCRIPTIONS model processes, so they
+    # are opt-in; fetch the model once before forking so they never download
+    # into (and clean up) the same directory at the same time
+    workers = int(os.environ.get("AUDIO_API_WORKERS", "1"))
+    if workers > 1:
+        from src.audio_transcription_cli.config import Config
+        from src.audio_transcription_cli.model_downloader import ModelDownloader
+
+        if not ModelDownloader(target_dir=Config().base_dir, warm_up=False).download():
+            raise SystemExit("Model download failed")
+
+    # Optional cap on open connections per worker (WebSocket sessions and
+    # keep-alive connections included); uvicorn answers excess ones with 503
+    limit = os.environ.get("AUDIO_API_LIMIT_CONCURRENCY")
+    limit_concurrency = int(limit) if limit else None
+
     uvicorn.run(
         "src.audio_transcription_cli.api:app",
-        host="0.0.0.0",
-        port=8001,
-        log_level="info",
+        **bind,
+        backlog=2048,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=limit_concurrency,
+        log_level="warning",
+        access_log=False,
         reload=False  # Disable reload for production
     )
-
@@ -2,29 +2,132 @@
 
 import asyncio
 import base64
+import functools
+import gzip
+import hashlib
 import io
 import json
+import logging
+import logging.handlers
 import os
-import tempfile
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
 from pathlib import Path
 
 import numpy as np
 import soundfile as sf
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import HTMLResponse, Response
+from pydantic import BaseModel, ValidationError
 
+# Optional decoders, resolved once at import rather than on every chunk
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+try:
+    from scipy import signal
+except ImportError:
+    signal = None
+
+# WebSocket messages go through orjson when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .audio_preprocessing import (
+    downmix_to_mono,
+    find_pause,
+    pcm16_to_float32,
+    rms_dbfs,
+    split_at_silence,
+)
 from .config import Config
 from .model_downloader import ModelDownloader
 from .model_wrapper import LFM2AudioWrapper
 
 app = FastAPI(title="Audio Transcription API", version="1.0.0")
 
+# Log records are queued from the event loop and written by a listener
+# thread, so a slow stdout/journald never blocks request handling
+logger = logging.getLogger(__name__)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener: logging.handlers.QueueListener | None = None
+
 # Global model instance (initialized on startup)
 model_wrapper: LFM2AudioWrapper | None = None
 model_downloader: ModelDownloader | None = None
 config: Config | None = None
 
+# Backpressure for live transcription: at most this many model runs at once
+# across all sessions, and a session that falls behind merges up to
+# up to MAX_MERGED_SECONDS of its waiting windows into one model run, well
+# inside the model's 30 s timeout. A session still further behind than
+# MAX_PENDING_WINDOWS drops its oldest windows
+MAX_CONCURRENT_TRANSCRIPTIONS = 4
+MAX_MERGED_SECONDS = 10
+MAX_PENDING_WINDOWS = 10
+transcription_slots = asyncio.Semaphore(MAX_CONCURRENT_TRANSCRIPTIONS)
+
+# Optional CPU split: AUDIO_API_CPU reserves one core for the event loop, and
+# ffmpeg and model runs get the rest; the default thread pool (fallback
+# decoding, base64, silence splitting) stays on the loop's core. Meant for a
+# single worker process; set up by startup_event
+API_CPU = os.environ.get("AUDIO_API_CPU")
+_WORKER_CPUS: set[int] | None = None
+
+
+def _pin_to_worker_cpus(pid: int = 0):
+    """Move a thread (0 = the calling one) or child process off the API core."""
+    if _WORKER_CPUS is None:
+        return
+    try:
+        os.sched_setaffinity(pid, _WORKER_CPUS)
+    except OSError:
+        pass  # The process may already have exited
+
+
+# Model runs get their own threads so they never queue behind decoding and
+# file I/O in the default executor; the model binaries they spawn inherit
+# their CPU affinity
+inference_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_TRANSCRIPTIONS,
+    thread_name_prefix="asr",
+    initializer=_pin_to_worker_cpus,
+)
+
+# Received chunks are acknowledged together at most once per this many
+# seconds, however small the client's chunks are
+ACK_INTERVAL = 2.0
+
+# A session keeps its audio only for the full-recording fallback; past this
+# size (about 11 minutes of pcm16) it stops keeping it, and an incomplete
+# live result is sent as the final transcript instead
+MAX_SESSION_AUDIO_BYTES = 64 * 1024 * 1024
+
+
+def dumps_message(payload: dict) -> str:
+    """Serialize a WebSocket message to compact JSON text."""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def loads_message(text: str) -> dict:
+    """Parse a JSON WebSocket message."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+async def send_message(websocket: WebSocket, payload: dict):
+    """Send a JSON message as a text frame."""
+    await websocket.send_text(dumps_message(payload))
+
 
 class TranscriptionRequest(BaseModel):
     """Request model for audio transcription."""
@@ -40,850 +143,179 @@ class TranscriptionResponse(BaseModel):
     error: str | None = None
 
 
+def _start_logging():
+    """Route this module's log records through the background listener."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _log_listener = logging.handlers.QueueListener(_log_queue, handler)
+    _log_listener.start()
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize model on startup."""
-    global model_wrapper, model_downloader, config
+    global model_wrapper, model_downloader, config, _WORKER_CPUS
+    
+    _start_logging()
+    logger.info("🚀 Initializing Audio Transcription API...")
     
-    print("🚀 Initializing Audio Transcription API...")
+    # On Linux this pins only the event loop thread; threads it starts later
+    # inherit the mask, which is why the inference threads re-pin themselves
+    if API_CPU is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            api_cpu = int(API_CPU)
+            _WORKER_CPUS = (os.sched_getaffinity(0) - {api_cpu}) or None
+            os.sched_setaffinity(0, {api_cpu})
+        except (ValueError, OSError) as e:
+            _WORKER_CPUS = None
+            logger.warning(f"⚠️  Could not pin the event loop to CPU {API_CPU}: {e}")
     config = Config()
     
+    # Up to MAX_CONCURRENT_TRANSCRIPTIONS model runs share the cores; left to
+    # its default, each llama.cpp process would start a thread per core
+    if config.model_threads is None:
+        cores = len(_WORKER_CPUS) if _WORKER_CPUS else (os.cpu_count() or 1)
+        config.model_threads = max(1, cores // MAX_CONCURRENT_TRANSCRIPTIONS)
+    
     try:
-        model_downloader = ModelDownloader(target_dir=config.base_dir)
+        # Warm up after download, once the binary is guaranteed to exist
+        model_downloader = ModelDownloader(target_dir=config.base_dir, warm_up=False)
         model_downloader.download()
         model_wrapper = LFM2AudioWrapper(model_downloader, config)
-        print("✅ Model initialized successfully")
+        logger.info("✅ Model initialized successfully")
     except Exception as e:
-        print(f"❌ Failed to initialize model: {e}")
+        logger.error(f"❌ Failed to initialize model: {e}")
         raise
+    
+    # Run one transcription of silence through the same path live windows
+    # take, so the first user request finds the weights in the page cache
+    try:
+        logger.info("🔥 Warming up model...")
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            inference_executor,
+            model_wrapper.transcribe_audio_data,
+            np.zeros(48000, dtype=np.int16),
+            48000
+        )
+        logger.info("✅ Model warm-up completed")
+    except Exception as e:
+        logger.warning(f"⚠️  Model warm-up failed: {e} (transcription will still work)")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush queued log records."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+# Frontend page, read and compressed once at import
+_INDEX_HTML_BYTES = (Path(__file__).parent / "static" / "index.html").read_bytes()
+_INDEX_HTML_GZIP = gzip.compress(_INDEX_HTML_BYTES, compresslevel=9)
+_INDEX_HTML_ETAG = f'W/"{hashlib.md5(_INDEX_HTML_BYTES).hexdigest()}"'
 
 
 @app.get("/", response_class=HTMLResponse)
-async def get_frontend():
+async def get_frontend(request: Request):
     """Serve the frontend HTML page."""
-    html_content = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Voice Transcriber</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: #f5f5f5;
-            min-height: 100vh;
-            padding: 0;
-        }
-        
-        .header {
-            background: white;
-            border-bottom: 1px solid #e0e0e0;
-            padding: 16px 24px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-        }
-        
-        .header-left {
-            display: flex;
-            align-items: center;
-            gap: 16px;
-        }
-        
-        .header-title {
-            font-size: 24px;
-            font-weight: 600;
-            color: #1a1a1a;
-        }
-        
-        .header-stats {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            color: #666;
-            font-size: 14px;
-        }
-        
-        .header-actions {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        }
-        
-        .connect-btn {
-            padding: 8px 16px;
-            background: #2563eb;
-            color: white;
-            border: none;
-            border-radius: 6px;
-            font-size: 14px;
-            font-weight: 500;
-            cursor: pointer;
-            transition: background 0.2s;
-        }
-        
-        .connect-btn:hover {
-            background: #1d4ed8;
-        }
-        
-        .settings-btn {
-            width: 36px;
-            height: 36px;
-            border: 1px solid #e0e0e0;
-            background: white;
-            border-radius: 6px;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: background 0.2s;
-        }
-        
-        .settings-btn:hover {
-            background: #f5f5f5;
-        }
-        
-        .main-container {
-            display: flex;
-            height: calc(100vh - 65px);
-            gap: 1px;
-            background: #e0e0e0;
-        }
-        
-        .left-panel {
-            flex: 0 0 400px;
-            background: white;
-            display: flex;
-            flex-direction: column;
-            overflow-y: auto;
-        }
-        
-        .right-panel {
-            flex: 1;
-            background: white;
-            display: flex;
-            flex-direction: column;
-        }
-        
-        .description {
-            padding: 16px 24px;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        
-        .description-text {
-            color: #666;
-            font-size: 14px;
-            line-height: 1.5;
-        }
-        
-        .section {
-            padding: 24px;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        
-        .section-title {
-            font-size: 12px;
-            font-weight: 600;
-            text-transform: uppercase;
-            color: #666;
-            margin-bottom: 12px;
-            letter-spacing: 0.5px;
-        }
-        
-        .dropdown {
-            width: 100%;
-            padding: 8px 12px;
-            border: 1px solid #e0e0e0;
-            border-radius: 6px;
-            font-size: 14px;
-            background: white;
-            cursor: pointer;
-        }
-        
-        .audio-visualizer-box {
-            background: #1e3a8a;
-            border-radius: 8px;
-            padding: 20px;
-            min-height: 120px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            position: relative;
-        }
-        
-        .audio-visualizer-box.active {
-            background: #2563eb;
-        }
-        
-        .visualizer-dots {
-            display: flex;
-            align-items: center;
-            gap: 6px;
-            height: 100%;
-        }
-        
-        .visualizer-dot {
-            width: 8px;
-            height: 8px;
-            background: rgba(255, 255, 255, 0.8);
-            border-radius: 50%;
-            animation: pulse-dot 1.5s ease-in-out infinite;
-        }
-        
-        @keyframes pulse-dot {
-            0%, 100% { 
-                opacity: 0.4;
-                transform: scale(1);
-            }
-            50% { 
-                opacity: 1;
-                transform: scale(1.2);
-            }
-        }
-        
-        .device-info {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            padding: 8px 0;
-            font-size: 14px;
-            color: #333;
-        }
-        
-        .device-icon {
-            width: 20px;
-            height: 20px;
-            opacity: 0.6;
-        }
-        
-        .wave-line {
-            height: 2px;
-            background: #e0e0e0;
-            margin: 8px 0;
-            border-radius: 1px;
-        }
-        
-        .chat-header {
-            padding: 16px 24px;
-            border-bottom: 1px solid #e0e0e0;
-            display: flex;
-            gap: 12px;
-            align-items: center;
-        }
-        
-        .chat-dropdown {
-            padding: 6px 12px;
-            border: 1px solid #e0e0e0;
-            border-radius: 6px;
-            font-size: 14px;
-            background: white;
-            cursor: pointer;
-        }
-        
-        .chat-container {
-            flex: 1;
-            overflow-y: auto;
-            padding: 24px;
-            display: flex;
-            flex-direction: column;
-            gap: 16px;
-        }
-        
-        .message {
-            display: flex;
-            gap: 12px;
-            animation: fadeIn 0.3s;
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .message-avatar {
-            width: 32px;
-            height: 32px;
-            border-radius: 50%;
-            flex-shrink: 0;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 18px;
-        }
-        
-        .message.transcriber .message-avatar {
-            background: #2563eb;
-            color: white;
-        }
-        
-        .message.user .message-avatar {
-            background: #e5e7eb;
-            color: #333;
-        }
-        
-        .message-content {
-            flex: 1;
-        }
-        
-        .message-label {
-            font-size: 12px;
-            font-weight: 600;
-            color: #666;
-            margin-bottom: 4px;
-        }
-        
-        .message-text {
-            font-size: 15px;
-            line-height: 1.6;
-            color: #1a1a1a;
-        }
-        
-        .empty-state {
-            flex: 1;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: #999;
-            font-size: 14px;
-            text-align: center;
-        }
-        
-        .record-button {
-            margin: 24px;
-            padding: 12px 24px;
-            background: #2563eb;
-            color: white;
-            border: none;
-            border-radius: 8px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.2s;
-            width: calc(100% - 48px);
-        }
-        
-        .record-button:hover:not(:disabled) {
-            background: #1d4ed8;
-            transform: translateY(-1px);
-        }
-        
-        .record-button.recording {
-            background: #dc2626;
-        }
-        
-        .record-button:disabled {
-            opacity: 0.6;
-            cursor: not-allowed;
-        }
-        
-        .loading {
-            display: inline-block;
-            width: 16px;
-            height: 16px;
-            border: 2px solid #f3f3f3;
-            border-top: 2px solid #2563eb;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-        }
-        
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <div class="header-left">
-            <h1 class="header-title">Voice Transcriber</h1>
-            <div class="header-stats">
-                <span>🔍</span>
-                <span id="sessionId">transcriber_001</span>
-            </div>
-        </div>
-        <div class="header-actions">
-            <button class="connect-btn" id="connectBtn">Connect</button>
-            <button class="settings-btn" title="Settings">⚙️</button>
-        </div>
-    </div>
+    # Browsers revalidate on every load and get a 304 while the page is
+    # unchanged, so a new server version is never shadowed by a cached page
+    headers = {
+        "ETag": _INDEX_HTML_ETAG,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if request.headers.get("if-none-match") == _INDEX_HTML_ETAG:
+        return Response(status_code=304, headers=headers)
     
-    <div class="main-container">
-        <div class="left-panel">
-            <div class="description">
-                <p class="description-text">Real-Time Voice Transcription System Powered by LFM2 Audio Model</p>
-            </div>
-            
-            <div class="section">
-                <div class="section-title">Audio & Voice</div>
-                <select class="dropdown" id="voiceSelect">
-                    <option>Default</option>
-                    <option>High Quality</option>
-                    <option>Fast Processing</option>
-                </select>
-                <div class="audio-visualizer-box" id="audioBox">
-                    <div class="visualizer-dots" id="visualizerDots"></div>
-                    <div style="position: absolute; color: white; font-size: 14px; font-weight: 500;" id="audioBoxText">Transcriber</div>
-                </div>
-            </div>
-            
-            <div class="section">
-                <div class="section-title">Microphone</div>
-                <div class="device-info">
-                    <span class="device-icon">🎤</span>
-                    <span id="micDevice">Default Microphone</span>
-                </div>
-                <div class="wave-line"></div>
-            </div>
-            
-            <div class="section">
-                <div class="section-title">Audio Input</div>
-                <div class="device-info">
-                    <span class="device-icon">🔊</span>
-                    <span>Live Audio Stream</span>
-                </div>
-            </div>
-            
-            <button class="record-button" id="recordBtn" onclick="toggleRecording()">
-                🎤 Start Recording
-            </button>
-        </div>
-        
-        <div class="right-panel">
-            <div class="chat-header">
-                <select class="chat-dropdown" id="modelSelect">
-                    <option>LFM2 Audio 1.5B</option>
-                    <option>High Accuracy Mode</option>
-                    <option>Fast Mode</option>
-                </select>
-                <select class="chat-dropdown" id="languageSelect">
-                    <option>English</option>
-                    <option>Multi-language</option>
-                </select>
-            </div>
-            
-            <div class="chat-container" id="chatContainer">
-                <div class="empty-state" id="emptyState">
-                    <div>
-                        <p style="font-size: 16px; margin-bottom: 8px;">Welcome to Voice Transcriber</p>
-                        <p style="font-size: 14px; color: #999;">Click "Start Recording" to begin transcribing your voice</p>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        let mediaRecorder;
-        let audioContext;
-        let analyser;
-        let dataArray;
-        let isRecording = false;
-        let ws = null;
-        let audioChunks = [];
-        let stream = null;
-        let transcriptHistory = [];
-        let accumulatedText = '';  // Accumulate transcriptions as they come in
-        
-        // Create visualizer dots
-        function createVisualizerDots() {
-            const container = document.getElementById('visualizerDots');
-            container.innerHTML = '';
-            for (let i = 0; i < 18; i++) {
-                const dot = document.createElement('div');
-                dot.className = 'visualizer-dot';
-                dot.style.animationDelay = (i * 0.08) + 's';
-                container.appendChild(dot);
-            }
-        }
-        
-        createVisualizerDots();
-        
-        // Get microphone devices
-        async function updateMicrophoneDevices() {
-            try {
-                const devices = await navigator.mediaDevices.enumerateDevices();
-                const audioInputs = devices.filter(device => device.kind === 'audioinput');
-                const micDeviceEl = document.getElementById('micDevice');
-                if (audioInputs.length > 0) {
-                    micDeviceEl.textContent = audioInputs[0].label || 'Default Microphone';
-                }
-            } catch (error) {
-                console.error('Error getting devices:', error);
-            }
-        }
-        
-        updateMicrophoneDevices();
-        
-        function toggleRecording() {
-            if (!isRecording) {
-                startRecording();
-            } else {
-                stopRecording();
-            }
-        }
-        
-        async function startRecording() {
-            try {
-                stream = await navigator.mediaDevices.getUserMedia({ 
-                    audio: {
-                        sampleRate: 48000,
-                        channelCount: 1,
-                        echoCancellation: true,
-                        noiseSuppression: true
-                    } 
-                });
-                
-                // Update device name
-                const tracks = stream.getAudioTracks();
-                if (tracks.length > 0) {
-                    document.getElementById('micDevice').textContent = tracks[0].label || 'Microphone';
-                }
-                
-                // Setup audio context
-                audioContext = new (window.AudioContext || window.webkitAudioContext)();
-                const source = audioContext.createMediaStreamSource(stream);
-                analyser = audioContext.createAnalyser();
-                analyser.fftSize = 256;
-                source.connect(analyser);
-                dataArray = new Uint8Array(analyser.frequencyBinCount);
-                
-                // Connect WebSocket
-                const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-                ws = new WebSocket(`${protocol}//${window.location.host}/ws/transcribe`);
-                
-                // Reset accumulated text for new session
-                accumulatedText = '';
-                
-                ws.onopen = () => {
-                    console.log('WebSocket connected');
-                };
-                
-                ws.onmessage = (event) => {
-                    const data = JSON.parse(event.data);
-                    if (data.status === 'transcription') {
-                        if (data.is_final) {
-                            // Final transcription - replace accumulated text
-                            accumulatedText = data.text;
-                            addMessage('transcriber', data.text, true);
-                        } else {
-                            // Partial transcription - show latest chunk text for live streaming
-                            // Each chunk is processed independently and we show the latest
-                            const newText = data.text.trim();
-                            if (newText) {
-                                // For live streaming, show the latest complete chunk
-                                // We'll accumulate properly when final transcription comes
-                                updateLatestMessage('transcriber', newText);
-                                // Also keep accumulating for final version
-                                if (!accumulatedText.includes(newText)) {
-                                    accumulatedText += (accumulatedText ? ' ' : '') + newText;
-                                }
-                            }
-                        }
-                    } else if (data.status === 'processing') {
-                        updateStatus('Processing audio...');
-                    } else if (data.status === 'error') {
-                        addMessage('transcriber', 'Error: ' + data.error, true);
-                    }
-                };
-                
-                ws.onerror = (error) => {
-                    console.error('WebSocket error:', error);
-                };
-                
-                ws.onclose = () => {
-                    console.log('WebSocket closed');
-                };
-                
-                // Setup MediaRecorder
-                const options = { mimeType: 'audio/webm;codecs=opus' };
-                if (!MediaRecorder.isTypeSupported(options.mimeType)) {
-                    options.mimeType = 'audio/webm';
-                    if (!MediaRecorder.isTypeSupported(options.mimeType)) {
-                        options.mimeType = '';
-                    }
-                }
-                
-                mediaRecorder = new MediaRecorder(stream, options);
-                audioChunks = [];
-                let chunkBuffer = [];
-                let chunkSendCounter = 0;
-                
-                // Buffer chunks before sending to ensure valid WebM files
-                mediaRecorder.ondataavailable = async (event) => {
-                    if (event.data.size > 0) {
-                        audioChunks.push(event.data);
-                        chunkBuffer.push(event.data);
-                        chunkSendCounter++;
-                        
-                        // Send chunks every 2 intervals (accumulate ~3-4 seconds of audio)
-                        // This ensures valid WebM files while still being responsive
-                        if (chunkSendCounter >= 2 && ws && ws.readyState === WebSocket.OPEN) {
-                            // Combine buffered chunks into a single blob
-                            const blob = new Blob(chunkBuffer, { type: 'audio/webm' });
-                            
-                            // Only send if blob is large enough to be a valid WebM file
-                            if (blob.size > 2000) {  // Minimum size for valid WebM
-                                const reader = new FileReader();
-                                reader.onloadend = () => {
-                                    const base64Audio = reader.result.split(',')[1];
-                                    if (ws && ws.readyState === WebSocket.OPEN) {
-                                        ws.send(JSON.stringify({
-                                            type: 'audio_chunk',
-                                            data: base64Audio,
-                                            format: 'webm',
-                                            sample_rate: 48000
-                                        }));
-                                    }
-                                };
-                                reader.readAsDataURL(blob);
-                                
-                                // Reset buffer
-                                chunkBuffer = [];
-                                chunkSendCounter = 0;
-                            }
-                        }
-                    }
-                };
-                
-                mediaRecorder.onstop = async () => {
-                    // Send any remaining buffered chunks
-                    if (chunkBuffer.length > 0 && ws && ws.readyState === WebSocket.OPEN) {
-                        const blob = new Blob(chunkBuffer, { type: 'audio/webm' });
-                        if (blob.size > 500) {
-                            const reader = new FileReader();
-                            reader.onloadend = () => {
-                                const base64Audio = reader.result.split(',')[1];
-                                if (ws && ws.readyState === WebSocket.OPEN) {
-                                    try {
-                                        ws.send(JSON.stringify({
-                                            type: 'audio_chunk',
-                                            data: base64Audio,
-                                            format: 'webm',
-                                            sample_rate: 48000
-                                        }));
-                                        // Send end signal after a short delay
-                                        setTimeout(() => {
-                                            if (ws && ws.readyState === WebSocket.OPEN) {
-                                                try {
-                                                    ws.send(JSON.stringify({ type: 'end' }));
-                                                } catch (e) {
-                                                    console.error('Error sending end signal:', e);
-                                                }
-                                            }
-                                        }, 200);
-                                    } catch (e) {
-                                        console.error('Error sending final chunk:', e);
-                                        // Try to send end signal anyway
-                                        if (ws && ws.readyState === WebSocket.OPEN) {
-                                            try {
-                                                ws.send(JSON.stringify({ type: 'end' }));
-                                            } catch (e2) {
-                                                console.error('Error sending end signal:', e2);
-                                            }
-                                        }
-                                    }
-                                }
-                            };
-                            reader.readAsDataURL(blob);
-                        } else {
-                            // No remaining chunks, just send end signal
-                            if (ws && ws.readyState === WebSocket.OPEN) {
-                                try {
-                                    ws.send(JSON.stringify({ type: 'end' }));
-                                } catch (e) {
-                                    console.error('Error sending end signal:', e);
-                                }
-                            }
-                        }
-                    } else {
-                        // Send end signal
-                        if (ws && ws.readyState === WebSocket.OPEN) {
-                            try {
-                                ws.send(JSON.stringify({ type: 'end' }));
-                            } catch (e) {
-                                console.error('Error sending end signal:', e);
-                            }
-                        }
-                    }
-                };
-                
-                // Record in 2-second chunks for better WebM validity
-                // We buffer 2 chunks before sending (so ~4 seconds per transmission)
-                mediaRecorder.start(2000);
-                isRecording = true;
-                
-                // Update UI
-                document.getElementById('recordBtn').classList.add('recording');
-                document.getElementById('recordBtn').textContent = '⏹ Stop Recording';
-                document.getElementById('audioBox').classList.add('active');
-                document.getElementById('audioBoxText').textContent = 'Listening...';
-                document.getElementById('connectBtn').textContent = 'Connected';
-                document.getElementById('connectBtn').style.background = '#16a34a';
-                
-                visualize();
-                updateMicrophoneDevices();
-                
-            } catch (error) {
-                console.error('Error accessing microphone:', error);
-                addMessage('transcriber', 'Microphone access denied. Please allow microphone access.', true);
-            }
-        }
-        
-        function stopRecording() {
-            if (mediaRecorder && isRecording) {
-                mediaRecorder.stop();
-                isRecording = false;
-                
-                if (audioContext) {
-                    audioContext.close();
-                }
-                
-                if (stream) {
-                    stream.getTracks().forEach(track => track.stop());
-                }
-                
-                document.getElementById('recordBtn').classList.remove('recording');
-                document.getElementById('recordBtn').textContent = '🎤 Start Recording';
-                document.getElementById('audioBox').classList.remove('active');
-                document.getElementById('audioBoxText').textContent = 'Transcriber';
-                document.getElementById('connectBtn').textContent = 'Connect';
-                document.getElementById('connectBtn').style.background = '#2563eb';
-            }
-        }
-        
-        function visualize() {
-            if (!isRecording || !analyser) return;
-            
-            analyser.getByteFrequencyData(dataArray);
-            requestAnimationFrame(visualize);
-        }
-        
-        function addMessage(sender, text, isFinal) {
-            const container = document.getElementById('chatContainer');
-            const emptyState = document.getElementById('emptyState');
-            
-            if (emptyState) {
-                emptyState.remove();
-            }
-            
-            const messageDiv = document.createElement('div');
-            messageDiv.className = `message ${sender}`;
-            messageDiv.id = sender === 'transcriber' && !isFinal ? 'latest-transcriber' : null;
-            
-            const avatar = document.createElement('div');
-            avatar.className = 'message-avatar';
-            avatar.textContent = sender === 'transcriber' ? '🤖' : '👤';
-            
-            const content = document.createElement('div');
-            content.className = 'message-content';
-            
-            const label = document.createElement('div');
-            label.className = 'message-label';
-            label.textContent = sender === 'transcriber' ? 'Transcriber' : 'You';
-            
-            const messageText = document.createElement('div');
-            messageText.className = 'message-text';
-            messageText.textContent = text;
-            
-            content.appendChild(label);
-            content.appendChild(messageText);
-            messageDiv.appendChild(avatar);
-            messageDiv.appendChild(content);
-            container.appendChild(messageDiv);
-            
-            container.scrollTop = container.scrollHeight;
-            
-            if (isFinal) {
-                transcriptHistory.push({ sender, text, timestamp: Date.now() });
-            }
-        }
-        
-        function updateLatestMessage(sender, text) {
-            let latestMsg = document.getElementById('latest-transcriber');
-            if (!latestMsg) {
-                addMessage(sender, text, false);
-            } else {
-                const textEl = latestMsg.querySelector('.message-text');
-                if (textEl) {
-                    textEl.textContent = text;
-                    const container = document.getElementById('chatContainer');
-                    container.scrollTop = container.scrollHeight;
-                }
-            }
-        }
-        
-        function updateStatus(message) {
-            console.log('Status:', message);
-        }
-        
-        // Connect button functionality
-        document.getElementById('connectBtn').addEventListener('click', function() {
-            if (!isRecording) {
-                startRecording();
-            } else {
-                stopRecording();
-            }
-        });
-    </script>
-</body>
-</html>
-    """
-    return HTMLResponse(content=html_content)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=_INDEX_HTML_GZIP, headers=headers)
+    return HTMLResponse(content=_INDEX_HTML_BYTES, headers=headers)
+
 
+@app.post(
+    "/api/transcribe",
+    response_model=TranscriptionResponse,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": TranscriptionRequest.model_json_schema()},
+                "audio/*": {"schema": {"type": "string", "format": "binary"}},
+            },
+            "required": True,
+        }
+    },
+)
+async def transcribe_audio(http_request: Request):
+    """
+    Transcribe uploaded audio.
 
-@app.post("/api/transcribe", response_model=TranscriptionResponse)
-async def transcribe_audio(request: TranscriptionRequest):
-    """Transcribe audio from base64 encoded data."""
+    The body is either a JSON ``TranscriptionRequest`` with base64 audio, or
+    the encoded audio itself with an ``audio/<format>`` content type, which
+    skips base64 entirely.
+    """
     global model_wrapper
     
     if model_wrapper is None:
         raise HTTPException(status_code=503, detail="Model not initialized")
     
+    body = await http_request.body()
+    content_type = http_request.headers.get("content-type", "")
+    loop = asyncio.get_event_loop()
+    
+    if content_type.startswith("audio/"):
+        # Raw upload: the body is the encoded audio
+        audio_bytes = body
+        file_ext = "." + content_type[len("audio/"):].split(";")[0].strip()
+    else:
+        # Parse and validate the raw body in one pass; FastAPI's default would
+        # first build a dict with json.loads and then validate that
+        try:
+            request = TranscriptionRequest.model_validate_json(body)
+        except ValidationError as e:
+            # Same 422 body FastAPI sends: error locations start at "body"
+            errors = [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+            raise RequestValidationError(errors, body=body) from e
+        audio_bytes = None
+        file_ext = f".{request.format}" if request.format else ".webm"
+    
     try:
-        # Decode base64 audio
-        audio_bytes = base64.b64decode(request.audio_data)
+        if audio_bytes is None:
+            # Decode base64 audio off the event loop
+            audio_bytes = await loop.run_in_executor(None, base64.b64decode, request.audio_data)
         
-        # Create temporary file
-        file_ext = f".{request.format}" if request.format else ".webm"
-        with tempfile.NamedTemporaryFile(suffix=file_ext, delete=False) as temp_file:
-            temp_file.write(audio_bytes)
-            temp_audio_path = temp_file.name
+        audio_data = await decode_audio([audio_bytes], file_ext)
+        
+        # Cut at pauses rather than into fixed overlapping chunks: no audio is
+        # transcribed twice, silence is never transcribed, and segments run
+        # concurrently on the inference threads
+        segments = await loop.run_in_executor(
+            None,
+            split_at_silence,
+            audio_data,
+            48000,
+            model_wrapper.config.silence_threshold_dbfs
+        )
+        texts = await asyncio.gather(
+            *(transcribe_segment(segment, model_wrapper) for segment in segments)
+        )
+        
+        return TranscriptionResponse(
+            text=" ".join(text for text in texts if text),
+            status="success"
+        )
         
-        try:
-            # Convert to WAV
-            wav_path = await convert_audio_to_wav(temp_audio_path, file_ext)
-            
-            # Transcribe
-            transcription = model_wrapper.transcribe_with_real_timing(
-                audio_file_path=wav_path,
-                chunk_duration=2.0,
-                overlap=0.5,
-                play_audio=False,
-                clean_text=False,
-            )
-            
-            return TranscriptionResponse(
-                text=transcription,
-                status="success"
-            )
-            
-        finally:
-            # Cleanup temp files
-            for path in [temp_audio_path, temp_audio_path.replace(file_ext, '.wav')]:
-                if os.path.exists(path) and path != temp_audio_path.replace(file_ext, '.wav'):
-                    try:
-                        os.unlink(path)
-                    except:
-                        pass
-                        
     except Exception as e:
         return TranscriptionResponse(
             text="",
@@ -892,159 +324,487 @@ async def transcribe_audio(request: TranscriptionRequest):
         )
 
 
-async def convert_audio_to_wav(input_path: str, input_ext: str) -> str:
-    """Convert audio file to WAV format."""
-    wav_path = input_path.replace(input_ext, '.wav')
-    
-    # Check file size
-    if not os.path.exists(input_path):
-        raise Exception(f"Input file not found: {input_path}")
+# Every WebM (Matroska) stream starts with this EBML header ID
+EBML_MAGIC = b'\x1a\x45\xdf\xa3'
+
+
+def _looks_like_webm(chunks: list[bytes]) -> bool:
+    """Check that encoded audio starts with the EBML header."""
+    # Take the first bytes chunk by chunk; joining would copy the recording
+    head = b''
+    for chunk in chunks:
+        head += chunk[:len(EBML_MAGIC) - len(head)]
+        if len(head) == len(EBML_MAGIC):
+            break
+    return head == EBML_MAGIC
+
+
+def _ffmpeg_timeout(size: int) -> float:
+    """Scale the ffmpeg timeout with input size: 5 s minimum, 1 s per 512 KiB, 120 s cap."""
+    return max(5.0, min(120.0, size / (512 * 1024)))
+
+
+async def _ffmpeg_decode(chunks: list[bytes], timeout: float | None = None) -> np.ndarray:
+    """
+    Decode audio through ffmpeg pipes to 48 kHz mono int16 PCM.
+
+    The encoded chunks are streamed into ffmpeg's stdin back to back and raw
+    s16le samples are read from its stdout, so nothing touches the disk.
+
+    Args:
+        timeout: Seconds before ffmpeg is killed; defaults to a limit scaled
+            by the input size so long recordings are not cut off
+    """
+    if timeout is None:
+        timeout = _ffmpeg_timeout(sum(map(len, chunks)))
     
-    file_size = os.path.getsize(input_path)
-    if file_size < 1000:  # Very small file, likely corrupted/incomplete WebM
-        raise Exception(f"Audio file too small ({file_size} bytes), likely corrupted or incomplete")
+    proc = await asyncio.create_subprocess_exec(
+        'ffmpeg', '-loglevel', 'error', '-i', 'pipe:0',
+        '-f', 's16le', '-acodec', 'pcm_s16le', '-ar', '48000', '-ac', '1', 'pipe:1',
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _pin_to_worker_cpus(proc.pid)
     
-    audio_data = None
-    sample_rate = None
+    async def feed():
+        try:
+            for chunk in chunks:
+                proc.stdin.write(chunk)
+                await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # ffmpeg gave up on the input; its stderr says why
+        finally:
+            proc.stdin.close()
     
-    # Try pydub first (better WebM support)
     try:
-        from pydub import AudioSegment
-        audio = AudioSegment.from_file(input_path)
-        audio = audio.set_frame_rate(48000).set_channels(1)
-        audio.export(wav_path, format="wav")
-        audio_data, sample_rate = sf.read(wav_path)
-    except Exception as pydub_error:
-        # Try ffmpeg conversion
-        import subprocess
+        _, stdout, stderr = await asyncio.wait_for(
+            asyncio.gather(feed(), proc.stdout.read(), proc.stderr.read()),
+            timeout=timeout
+        )
+        await proc.wait()
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise Exception("ffmpeg conversion timed out")
+    
+    if proc.returncode != 0:
+        raise Exception(f"ffmpeg conversion failed: {stderr.decode('utf-8', errors='ignore')}")
+    
+    return np.frombuffer(stdout, dtype=np.int16)
+
+
+@functools.lru_cache(maxsize=16)
+def _resample_filter(sample_rate: int) -> tuple[int, int, np.ndarray]:
+    """
+    Design the polyphase filter for resampling from ``sample_rate`` to 48 kHz.
+
+    Returns:
+        Tuple of (up, down, taps); taps are the Kaiser-windowed low-pass that
+        ``resample_poly`` would otherwise redesign on every call, stored as
+        float32 so filtering float32 samples never promotes them to float64
+    """
+    if signal is None:
+        raise Exception(f"Resampling from {sample_rate} Hz requires scipy")
+    ratio = Fraction(48000, sample_rate).limit_denominator(1000)
+    up, down = ratio.numerator, ratio.denominator
+    max_rate = max(up, down)
+    taps = signal.firwin(20 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+    return up, down, taps.astype(np.float32)
+
+
+def _decode_in_process(chunks: list[bytes], input_ext: str, use_pydub: bool = True) -> np.ndarray:
+    """
+    Decode audio with pydub, falling back to soundfile, to 48 kHz mono.
+
+    Blocking; run it in an executor.
+
+    Args:
+        chunks: Encoded audio, as one or more consecutive byte chunks
+        use_pydub: Try pydub first; it only helps for inputs ffmpeg cannot
+            read from a pipe, and otherwise re-runs ffmpeg for nothing
+
+    Returns:
+        Mono samples at 48 kHz; int16, or float32 in [-1, 1] if resampled
+    """
+    audio_bytes = b''.join(chunks)
+    
+    # Try pydub conversion
+    pydub_error = None
+    if use_pydub:
         try:
-            result = subprocess.run(
-                ['ffmpeg', '-i', input_path, '-ar', '48000', '-ac', '1', '-f', 'wav', '-y', wav_path],
-                check=True,
-                capture_output=True,
-                timeout=15
-            )
-            if not os.path.exists(wav_path):
-                raise Exception("ffmpeg conversion failed - output file not created")
-            audio_data, sample_rate = sf.read(wav_path)
-        except subprocess.CalledProcessError as e:
-            error_output = e.stderr.decode('utf-8', errors='ignore') if e.stderr else str(e)
-            raise Exception(f"ffmpeg conversion failed: {error_output}")
-        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
-            # Try direct read as fallback
-            try:
-                audio_data, sample_rate = sf.read(input_path)
-            except Exception as read_error:
-                raise Exception(f"All conversion methods failed. Pydub: {str(pydub_error)}, FFmpeg: {str(e)}, Direct read: {str(read_error)}")
+            if AudioSegment is None:
+                raise Exception("pydub is not installed")
+            audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format=input_ext.lstrip('.'))
+            audio = audio.set_frame_rate(48000).set_channels(1).set_sample_width(2)
+            return np.frombuffer(audio.raw_data, dtype=np.int16)
+        except Exception as e:
+            pydub_error = e
     
-    if audio_data is None or len(audio_data) == 0:
-        raise Exception("Failed to read audio data or empty audio")
+    # Try direct read as fallback
+    try:
+        audio_data, sample_rate = sf.read(io.BytesIO(audio_bytes), dtype='int16')
+    except Exception as read_error:
+        if pydub_error is None:
+            raise Exception(f"Direct read: {str(read_error)}") from read_error
+        raise Exception(f"Pydub: {str(pydub_error)}, Direct read: {str(read_error)}") from read_error
     
-    # Ensure mono and correct sample rate
+    # Ensure mono and correct sample rate; samples stay int16 unless they
+    # need mixing or resampling
     if len(audio_data.shape) > 1:
-        audio_data = np.mean(audio_data, axis=1)
+        audio_data = downmix_to_mono(audio_data)
     
     if sample_rate != 48000:
-        from scipy import signal
-        num_samples = int(len(audio_data) * 48000 / sample_rate)
-        if num_samples > 0:
-            audio_data = signal.resample(audio_data, num_samples)
-            sample_rate = 48000
-        else:
-            raise Exception("Invalid audio data after resampling")
-    
-    # Save as WAV
-    sf.write(wav_path, audio_data, sample_rate, subtype='PCM_16')
+        if audio_data.dtype == np.int16:
+            audio_data = pcm16_to_float32(audio_data)
+        up, down, taps = _resample_filter(sample_rate)
+        audio_data = signal.resample_poly(audio_data, up, down, window=taps)
     
-    # Verify output file
-    if not os.path.exists(wav_path) or os.path.getsize(wav_path) < 100:
-        raise Exception("Failed to create valid WAV file")
-    
-    return wav_path
+    return audio_data
+
 
+async def decode_audio(chunks: list[bytes], input_ext: str, use_pydub: bool = True) -> np.ndarray:
+    """
+    Decode uploaded audio in memory to 48 kHz mono samples.
 
-async def process_audio_chunk_live(websocket: WebSocket, audio_bytes: bytes, chunk_num: int, model: LFM2AudioWrapper):
-    """Process a single audio chunk for live streaming transcription."""
-    temp_path = None
-    wav_path = None
+    Args:
+        chunks: Encoded audio, as one or more consecutive byte chunks
+        input_ext: File extension of the encoded audio (e.g. ".webm")
+        use_pydub: Try pydub if ffmpeg fails on the piped input
+
+    Returns:
+        Mono samples at 48 kHz; int16, or float32 in [-1, 1] if resampled
+    """
+    # Check input size
+    input_size = sum(map(len, chunks))
+    if input_size < 1000:  # Very small file, likely corrupted/incomplete WebM
+        raise Exception(f"Audio file too small ({input_size} bytes), likely corrupted or incomplete")
     
+    # Truncated or misframed WebM would otherwise tie up ffmpeg (and every
+    # fallback) until it gives up
+    if input_ext == '.webm' and not _looks_like_webm(chunks):
+        raise Exception("Audio is not a WebM stream (missing EBML header)")
+    
+    # Try ffmpeg first: it decodes WebM from stdin straight to 48 kHz mono
+    # PCM on stdout
     try:
-        # Create temp file
-        with tempfile.NamedTemporaryFile(suffix='.webm', delete=False) as temp_file:
-            temp_file.write(audio_bytes)
-            temp_path = temp_file.name
-        
-        # Convert to WAV
-        wav_path = await convert_audio_to_wav(temp_path, '.webm')
-        
-        # Transcribe chunk (fast method - non-blocking)
+        audio_data = await _ffmpeg_decode(chunks)
+    except Exception as ffmpeg_error:
+        # The fallback decoders and the resampler block; keep them off the
+        # event loop
         loop = asyncio.get_event_loop()
+        try:
+            audio_data = await loop.run_in_executor(
+                None, _decode_in_process, chunks, input_ext, use_pydub
+            )
+        except Exception as fallback_error:
+            raise Exception(f"All conversion methods failed. FFmpeg: {str(ffmpeg_error)}, {str(fallback_error)}")
+    
+    if len(audio_data) == 0:
+        raise Exception("Failed to read audio data or empty audio")
+    
+    return audio_data
+
+
+class StreamingDecoder:
+    """
+    One long-lived ffmpeg process decoding a WebSocket session's audio stream.
+
+    MediaRecorder emits a single continuous WebM stream, so only its first
+    chunk carries the container header. Feeding every chunk into the same
+    ffmpeg stdin decodes the whole stream with one process instead of forking
+    ffmpeg per chunk; the decoded 48 kHz mono int16 PCM is cut into windows
+    at pauses by a ``PcmWindower``.
+    """
+
+    def __init__(self, threshold_dbfs: float, window_seconds: float = 2.0, max_window_seconds: float = 6.0):
+        """
+        Initialize the decoder.
+
+        Args:
+            threshold_dbfs: RMS level below which audio counts as a pause
+            window_seconds: Shortest PCM window handed to the model
+            max_window_seconds: Longest window, cut even without a pause
+        """
+        self._windower = PcmWindower(threshold_dbfs, window_seconds, max_window_seconds)
+        self.windows: asyncio.Queue = self._windower.windows
+        self._proc = None
+        self._reader = None
+
+    def pending(self) -> int:
+        """Number of queued windows, not counting the end marker."""
+        return self._windower.pending()
+
+    async def start(self):
+        """Spawn ffmpeg and start collecting decoded windows."""
+        self._proc = await asyncio.create_subprocess_exec(
+            'ffmpeg', '-loglevel', 'error', '-f', 'webm', '-i', 'pipe:0',
+            '-f', 's16le', '-acodec', 'pcm_s16le', '-ar', '48000', '-ac', '1', 'pipe:1',
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        _pin_to_worker_cpus(self._proc.pid)
+        self._reader = asyncio.create_task(self._read_windows())
+
+    async def feed(self, audio_bytes: bytes):
+        """Pass the next chunk of the encoded stream to ffmpeg."""
+        self._proc.stdin.write(audio_bytes)
+        await self._proc.stdin.drain()
+
+    async def finish(self) -> bool:
+        """
+        Signal end of stream and wait for the last window to be flushed.
+
+        Returns:
+            True if ffmpeg decoded the whole stream without error
+        """
+        if not self._proc.stdin.is_closing():
+            self._proc.stdin.close()
+        await self._reader
+        return await self._proc.wait() == 0
+
+    async def close(self):
+        """Stop ffmpeg and the reader task."""
+        if self._reader:
+            self._reader.cancel()
+        if self._proc and self._proc.returncode is None:
+            self._proc.kill()
+            await self._proc.wait()
+
+    async def _read_windows(self):
+        """Window ffmpeg's PCM output as it arrives; ``None`` marks the end."""
+        try:
+            while block := await self._proc.stdout.read(65536):
+                await self._windower.feed(block)
+        finally:
+            await self._windower.finish()
+
+
+def _join_pcm(chunks: list[bytes]) -> np.ndarray:
+    """Concatenate raw int16 PCM chunks into one array without a second copy."""
+    pcm = b''.join(chunks)
+    return np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2)
+
+
+class PcmWindower:
+    """
+    Windows a session's raw PCM stream for clients that need no decoding.
+
+    Clients connecting with ``format=pcm16`` capture 48 kHz mono int16 PCM
+    themselves and send it as binary frames. This has the same interface as
+    ``StreamingDecoder``, but only cuts the incoming bytes into windows.
+
+    Windows end at the first pause after ``window_seconds``, so words are not
+    split between two model runs and the windows' texts join into the final
+    transcript; without a pause, a window is cut at ``max_window_seconds``.
+    """
+
+    def __init__(self, threshold_dbfs: float, window_seconds: float = 2.0, max_window_seconds: float = 6.0):
+        """
+        Initialize the windower.
+
+        Args:
+            threshold_dbfs: RMS level below which audio counts as a pause
+            window_seconds: Shortest PCM window handed to the model
+            max_window_seconds: Longest window, cut even without a pause
+        """
+        self.threshold_dbfs = threshold_dbfs
+        self.window_bytes = int(48000 * window_seconds) * 2
+        self.max_window_bytes = int(48000 * max_window_seconds) * 2
+        self.windows: asyncio.Queue = asyncio.Queue()
+        self._buffer = bytearray()
+        self._scanned = 0
+        self._finished = False
+
+    async def start(self):
+        """Nothing to spawn; present for interface parity."""
+
+    def pending(self) -> int:
+        """Number of queued windows, not counting the end marker."""
+        return self.windows.qsize() - self._finished
+
+    async def feed(self, audio_bytes: bytes):
+        """Append PCM and queue every complete window."""
+        self._buffer += audio_bytes
+        while len(self._buffer) >= self.window_bytes and (cut := self._find_cut()):
+            block = bytes(self._buffer[:cut])
+            del self._buffer[:cut]
+            self._scanned = 0
+            await self.windows.put(np.frombuffer(block, dtype=np.int16))
+
+    def _find_cut(self) -> int | None:
+        """Pick where the current window ends, or None to wait for more audio."""
+        # Only scan audio not scanned before, backing up far enough that a
+        # pause spanning two feeds is still found
+        pause_bytes = int(48000 * 0.2) * 2
+        start = max(self.window_bytes, self._scanned) - pause_bytes
+        start = min(start - start % 2, self.max_window_bytes - pause_bytes)
+        end = min(len(self._buffer), self.max_window_bytes)
+        pcm = np.frombuffer(bytes(self._buffer[start:end]), dtype=np.int16, count=(end - start) // 2)
+        
+        pause = find_pause(pcm, 48000, self.threshold_dbfs)
+        if pause is not None:
+            return start + pause * 2
+        self._scanned = end
+        if len(self._buffer) >= self.max_window_bytes:
+            return self.max_window_bytes
+        return None
+
+    async def finish(self) -> bool:
+        """
+        Queue the partial last window and mark the end.
+
+        Returns:
+            Always True; raw PCM cannot fail to decode
+        """
+        tail = bytes(self._buffer[:len(self._buffer) // 2 * 2])
+        self._buffer.clear()
+        if tail:
+            await self.windows.put(np.frombuffer(tail, dtype=np.int16))
+        await self.windows.put(None)
+        self._finished = True
+        return True
+
+    async def close(self):
+        """Nothing to stop; present for interface parity."""
+
+
+async def transcribe_segment(pcm: np.ndarray, model: LFM2AudioWrapper) -> str:
+    """Transcribe 48 kHz mono samples once a transcription slot is free."""
+    loop = asyncio.get_event_loop()
+    async with transcription_slots:
         transcription = await loop.run_in_executor(
-            None,
-            model.transcribe_audio_file,
-            wav_path
+            inference_executor,
+            model.transcribe_audio_data,
+            pcm,
+            48000
         )
+    return transcription.strip()
+
+
+async def process_audio_chunk_live(websocket: WebSocket, pcm: np.ndarray, chunk_num: int, model: LFM2AudioWrapper) -> str | None:
+    """
+    Transcribe one decoded PCM window for live streaming transcription.
+
+    Returns:
+        The window's text ("" if silent), or None if transcription failed
+    """
+    # Silent windows cost as much to transcribe as speech; skip them
+    if rms_dbfs(pcm) < model.config.silence_threshold_dbfs:
+        return ""
+    
+    try:
+        # Transcribe chunk (fast method - non-blocking)
+        transcription = await transcribe_segment(pcm, model)
         
         # Send partial result immediately for live streaming
-        if transcription and len(transcription.strip()) > 0:
-            await websocket.send_json({
+        if transcription:
+            await send_message(websocket, {
                 "status": "transcription",
-                "text": transcription.strip(),
+                "text": transcription,
                 "is_final": False,
                 "chunk": chunk_num
             })
         
+        return transcription
+        
     except Exception as e:
         # Don't send error for individual chunks - just log (silent failure for live streaming)
-        # Filter out expected errors (small/invalid chunks)
-        error_msg = str(e)
-        if "small" not in error_msg.lower() and "invalid" not in error_msg.lower() and "corrupted" not in error_msg.lower():
-            print(f"Warning processing chunk {chunk_num}: {error_msg[:100]}")
-    finally:
-        # Cleanup temp files
-        for path in [temp_path, wav_path]:
-            if path and os.path.exists(path):
-                try:
-                    os.unlink(path)
-                except:
-                    pass
-
-
-async def process_final_audio(websocket: WebSocket, chunks: list, model: LFM2AudioWrapper):
-    """Process final complete audio and send final transcription."""
-    temp_path = None
-    wav_path = None
-    
+        logger.warning(f"Warning processing chunk {chunk_num}: {str(e)[:100]}")
+        return None
+
+
+async def transcribe_live_windows(websocket: WebSocket, decoder: StreamingDecoder, model: LFM2AudioWrapper) -> list[str | None]:
+    """
+    Transcribe the windows the session decoder produces, in order.
+
+    Windows that queue up while the model is busy are transcribed together;
+    beyond ``MAX_PENDING_WINDOWS`` the oldest are dropped, so a session whose
+    model runs are slower than real time keeps bounded memory and latency.
+
+    Returns:
+        Per-run results from ``process_audio_chunk_live``
+    """
+    parts = []
+    chunk_num = 0
+    ended = False
+    carried = None  # Window that did not fit into the previous merged run
+    while not ended:
+        pcm = carried if carried is not None else await decoder.windows.get()
+        carried = None
+        if pcm is None:
+            break
+        chunk_num += 1
+        while decoder.pending() > MAX_PENDING_WINDOWS:
+            # Too far behind even for merging; a dropped window counts as
+            # missing, so the final transcript falls back to the full recording
+            parts.append(None)
+            await send_message(websocket, {"status": "dropped", "chunk": chunk_num})
+            pcm = decoder.windows.get_nowait()
+            chunk_num += 1
+        
+        # Behind real time: every model run pays a fixed startup cost, so one
+        # run over the waiting windows catches up faster than one run per window
+        merged = [pcm]
+        merged_samples = len(pcm)
+        while not decoder.windows.empty():
+            pending = decoder.windows.get_nowait()
+            if pending is None:
+                ended = True
+                break
+            if merged_samples + len(pending) > MAX_MERGED_SECONDS * 48000:
+                carried = pending
+                break
+            merged.append(pending)
+            merged_samples += len(pending)
+            chunk_num += 1
+        if len(merged) > 1:
+            pcm = np.concatenate(merged)
+            await send_message(websocket, {"status": "backpressure", "merged": len(merged)})
+        parts.append(await process_audio_chunk_live(websocket, pcm, chunk_num, model))
+    return parts
+
+
+async def process_final_audio(websocket: WebSocket, chunks: list, model: LFM2AudioWrapper, raw_pcm: bool = False):
+    """
+    Process final complete audio and send final transcription.
+
+    Args:
+        raw_pcm: Chunks are 48 kHz mono int16 PCM rather than an encoded stream
+    """
     try:
-        # Combine all chunks
-        complete_audio = b''.join(chunks)
-        
-        if len(complete_audio) == 0:
+        if sum(map(len, chunks)) == 0:
             raise Exception("Empty audio data")
         
-        # Create temp file
-        with tempfile.NamedTemporaryFile(suffix='.webm', delete=False) as temp_file:
-            temp_file.write(complete_audio)
-            temp_path = temp_file.name
-        
-        # Convert to WAV
-        await websocket.send_json({
+        # Decode in memory; chunks are piped to the decoder back to back, so
+        # the complete recording is never copied into one combined bytes object
+        await send_message(websocket, {
             "status": "processing",
             "message": "Processing final audio..."
         })
         
-        wav_path = await convert_audio_to_wav(temp_path, '.webm')
+        if raw_pcm:
+            # Joining a long recording copies tens of MB; keep it off the loop
+            loop = asyncio.get_event_loop()
+            audio_data = await loop.run_in_executor(None, _join_pcm, chunks)
+        else:
+            # A WebM stream that ffmpeg cannot read from a pipe will not
+            # decode through pydub's ffmpeg either
+            audio_data = await decode_audio(chunks, '.webm', use_pydub=False)
         
-        # Transcribe final audio
+        # Transcribe the decoded samples directly; the wrapper writes the one
+        # WAV the model binary needs and removes it afterwards
         loop = asyncio.get_event_loop()
         transcription = await loop.run_in_executor(
-            None,
-            model.transcribe_audio_file,
-            wav_path
+            inference_executor,
+            model.transcribe_audio_data,
+            audio_data,
+            48000
         )
         
         # Send final result
-        await websocket.send_json({
+        await send_message(websocket, {
             "status": "transcription",
             "text": transcription,
             "is_final": True
@@ -1052,19 +812,11 @@ async def process_final_audio(websocket: WebSocket, chunks: list, model: LFM2Aud
         
     except Exception as e:
         error_msg = str(e)
-        print(f"Error processing final audio: {error_msg}")
-        await websocket.send_json({
+        logger.error(f"Error processing final audio: {error_msg}")
+        await send_message(websocket, {
             "status": "error",
             "error": f"Audio processing failed: {error_msg}"
         })
-    finally:
-        # Cleanup
-        for path in [temp_path, wav_path]:
-            if path and os.path.exists(path):
-                try:
-                    os.unlink(path)
-                except:
-                    pass
 
 
 @app.websocket("/ws/transcribe")
@@ -1075,7 +827,7 @@ async def websocket_transcribe(websocket: WebSocket):
     await websocket.accept()
     
     if model_wrapper is None:
-        await websocket.send_json({
+        await send_message(websocket, {
             "status": "error",
             "error": "Model not initialized"
         })
@@ -1083,70 +835,158 @@ async def websocket_transcribe(websocket: WebSocket):
         return
     
     all_audio_chunks = []
+    session_bytes = 0
     chunk_count = 0
-    processing_tasks = []
+    pending_acks = []
+    loop = asyncio.get_event_loop()
+    last_ack = loop.time()
+    
+    # Decode the whole session with one ffmpeg process, or just window it when
+    # the client sends raw PCM, and transcribe window by window in the
+    # background
+    raw_pcm = websocket.query_params.get("format") == "pcm16"
+    threshold = model_wrapper.config.silence_threshold_dbfs
+    decoder = PcmWindower(threshold) if raw_pcm else StreamingDecoder(threshold)
+    live_task = None
+    try:
+        await decoder.start()
+        live_task = asyncio.create_task(
+            transcribe_live_windows(websocket, decoder, model_wrapper)
+        )
+    except Exception as e:
+        logger.warning(f"Live decoding unavailable, only the final transcription will be sent: {e}")
+        decoder = None
     
     try:
         while True:
             data = await websocket.receive()
             
-            if "text" in data:
-                message = json.loads(data["text"])
+            if data["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(data.get("code", 1000))
+            
+            audio_bytes = None
+            if data.get("bytes") is not None:
+                # Binary frame: the audio chunk itself
+                audio_bytes = data["bytes"]
+            elif data.get("text") is not None:
+                message = loads_message(data["text"])
                 
                 if message.get("type") == "audio_chunk":
-                    # Store audio chunk
+                    # Legacy clients send base64 audio inside JSON
                     try:
-                        audio_bytes = base64.b64decode(message["data"])
-                        all_audio_chunks.append(audio_bytes)
-                        chunk_count += 1
-                        
-                        # Process chunk immediately for live streaming
-                        # Only process if chunk is large enough to be a valid WebM file
-                        if len(audio_bytes) > 2000:  # Minimum size for valid WebM file
-                            # Process in background without blocking
-                            task = asyncio.create_task(
-                                process_audio_chunk_live(websocket, audio_bytes, chunk_count, model_wrapper)
-                            )
-                            processing_tasks.append(task)
-                        
-                        # Send acknowledgment
-                        await websocket.send_json({
-                            "status": "received",
-                            "chunk": chunk_count
-                        })
+                        audio_bytes = await loop.run_in_executor(None, base64.b64decode, message["data"])
                     except Exception as e:
-                        await websocket.send_json({
+                        await send_message(websocket, {
                             "status": "error",
                             "error": f"Failed to decode audio chunk: {str(e)}"
                         })
                         
                 elif message.get("type") == "end":
-                    # Wait for any pending processing tasks
-                    if processing_tasks:
-                        await asyncio.gather(*processing_tasks, return_exceptions=True)
+                    if pending_acks:
+                        await send_message(websocket, {"status": "received", "chunks": pending_acks})
+                        pending_acks = []
                     
-                    # Process final audio for complete transcription
-                    if all_audio_chunks:
-                        await process_final_audio(websocket, all_audio_chunks, model_wrapper)
-                    else:
-                        await websocket.send_json({
+                    # Let the live decoder flush and transcribe its last window
+                    parts = []
+                    live_parts = None
+                    if decoder:
+                        decoded_all = await decoder.finish()
+                        parts = await live_task
+                        if decoded_all and None not in parts:
+                            live_parts = parts
+                    
+                    if session_bytes == 0:
+                        await send_message(websocket, {
                             "status": "error",
                             "error": "No audio data received"
                         })
+                    elif live_parts is not None:
+                        # The live windows already cover the whole recording
+                        await send_message(websocket, {
+                            "status": "transcription",
+                            "text": " ".join(part for part in live_parts if part),
+                            "is_final": True
+                        })
+                    elif all_audio_chunks:
+                        # Live results are incomplete; transcribe the full recording
+                        await process_final_audio(websocket, all_audio_chunks, model_wrapper, raw_pcm)
+                    else:
+                        # Too long to keep for the fallback; send what the live
+                        # windows produced
+                        await send_message(websocket, {
+                            "status": "transcription",
+                            "text": " ".join(part for part in parts if part),
+                            "is_final": True,
+                            "complete": False
+                        })
                     break
+            
+            if audio_bytes is not None:
+                # Store audio chunk for the fallback, up to the session limit
+                session_bytes += len(audio_bytes)
+                if session_bytes <= MAX_SESSION_AUDIO_BYTES:
+                    all_audio_chunks.append(audio_bytes)
+                elif all_audio_chunks:
+                    logger.warning("Session audio exceeds the buffer limit; the full-recording fallback is disabled")
+                    all_audio_chunks = []
+                chunk_count += 1
+                
+                # A WebM session must open with the EBML header; without it
+                # the decoder can never produce audio, so stop it right away
+                if chunk_count == 1 and not raw_pcm and decoder and not _looks_like_webm([audio_bytes]):
+                    logger.warning("Session audio does not start with an EBML header; live decoding disabled")
+                    await decoder.close()
+                    decoder = None
+                
+                # Stream chunk into the session decoder for live transcription
+                if decoder:
+                    try:
+                        await decoder.feed(audio_bytes)
+                    except (BrokenPipeError, ConnectionResetError):
+                        logger.warning("Live decoder exited; only the final transcription will be sent")
+                        await decoder.close()
+                        decoder = None
+                
+                # Acknowledge received chunks in batches
+                pending_acks.append(chunk_count)
+                if loop.time() - last_ack >= ACK_INTERVAL:
+                    await send_message(websocket, {
+                        "status": "received",
+                        "chunks": pending_acks
+                    })
+                    pending_acks = []
+                    last_ack = loop.time()
                     
     except WebSocketDisconnect:
-        print("Client disconnected")
+        logger.info("Client disconnected")
     except Exception as e:
-        await websocket.send_json({
+        await send_message(websocket, {
             "status": "error",
             "error": str(e)
         })
     finally:
         # Cleanup
-        pass
-
+        if live_task:
+            live_task.cancel()
+        if decoder:
+            await decoder.close()
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Same server stack as run_api.py; extra workers need the import string.
+    # Workers are opt-in, and the model is fetched once before forking so
+    # they never download into the same directory at the same time
+    workers = int(os.environ.get("AUDIO_API_WORKERS", "1"))
+    if workers > 1:
+        if not ModelDownloader(target_dir=Config().base_dir, warm_up=False).download():
+            raise SystemExit("Model download failed")
+    uvicorn.run(
+        "audio_transcription_cli.api:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+    )
+
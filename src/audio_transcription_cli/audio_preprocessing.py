@@ -1,11 +1,54 @@
 """Audio preprocessing module for LFM2 model compatibility."""
 
+import os
 import tempfile
 from collections.abc import Iterator
 
 import numpy as np
 import soundfile as sf
 
+# Temp WAVs only live for one model run; keep them in RAM when tmpfs exists,
+# unless TMPDIR says where temp files go. Containers often get a small
+# /dev/shm (64 MB by default in Docker), so WAVs larger than
+# MAX_TMPFS_WAV_BYTES, or ones that do not fit, go to the regular temp dir
+TEMP_AUDIO_DIR = (
+    "/dev/shm" if "TMPDIR" not in os.environ and os.path.isdir("/dev/shm") else None
+)
+MAX_TMPFS_WAV_BYTES = 8 * 1024 * 1024
+
+
+def _write_temp_wav(audio_data: np.ndarray, sample_rate: int, **mkstemp_args) -> str:
+    """
+    Write 16-bit PCM WAV data to a new temporary file.
+
+    Args:
+        audio_data: Samples to write
+        sample_rate: Sample rate of the samples
+        **mkstemp_args: Passed to ``tempfile.mkstemp`` (suffix, prefix)
+
+    Returns:
+        Path to the temporary WAV file
+    """
+    use_tmpfs = (
+        TEMP_AUDIO_DIR is not None and audio_data.size * 2 <= MAX_TMPFS_WAV_BYTES
+    )
+    fd, temp_path = tempfile.mkstemp(
+        dir=TEMP_AUDIO_DIR if use_tmpfs else None, **mkstemp_args
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            sf.write(f, audio_data, sample_rate, subtype="PCM_16", format="WAV")
+    except Exception:
+        os.unlink(temp_path)
+        if not use_tmpfs:
+            raise
+        # tmpfs is full; fall back to disk
+        fd, temp_path = tempfile.mkstemp(**mkstemp_args)
+        with os.fdopen(fd, "wb") as f:
+            sf.write(f, audio_data, sample_rate, subtype="PCM_16", format="WAV")
+
+    return temp_path
+
 
 def save_raw_audio_as_wav(audio_data: np.ndarray, sample_rate: int = 48000) -> str:
     """
@@ -18,16 +61,165 @@ def save_raw_audio_as_wav(audio_data: np.ndarray, sample_rate: int = 48000) -> s
     Returns:
         Path to temporary WAV file
     """
-    # Create temporary WAV file
-    fd, temp_path = tempfile.mkstemp(suffix=".wav")
-    import os
+    # Create temporary WAV file and write through the open descriptor
+    return _write_temp_wav(audio_data, sample_rate, suffix=".wav")
 
-    os.close(fd)
 
-    # Save raw audio directly as WAV
-    sf.write(temp_path, audio_data, sample_rate, subtype="PCM_16")
+def pcm16_to_float32(pcm: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Convert int16 PCM samples to float32 in [-1, 1) in a single pass.
 
-    return temp_path
+    The cast and the scale are fused into one ufunc call, so no intermediate
+    float array is allocated.
+
+    Args:
+        pcm: int16 audio samples
+        out: Optional preallocated float32 array of the same shape to reuse
+
+    Returns:
+        float32 audio samples (``out`` if it was given)
+    """
+    if out is None:
+        out = np.empty(pcm.shape, dtype=np.float32)
+    np.multiply(pcm, np.float32(1.0 / 32768.0), out=out, dtype=np.float32)
+    return out
+
+
+def downmix_to_mono(pcm: np.ndarray) -> np.ndarray:
+    """
+    Average multi-channel int16 PCM down to mono int16.
+
+    Channels are summed in int32 and shifted (stereo) or divided back, so
+    the mix needs neither a float conversion nor ``np.mean``'s temporaries.
+
+    Args:
+        pcm: int16 audio samples shaped (frames, channels)
+
+    Returns:
+        Mono int16 audio samples
+    """
+    channels = pcm.shape[1]
+    if channels == 2:
+        mixed = pcm[:, 0].astype(np.int32)
+        mixed += pcm[:, 1]
+        mixed >>= 1
+    else:
+        mixed = pcm.sum(axis=1, dtype=np.int32)
+        mixed //= channels
+    return mixed.astype(np.int16)
+
+
+def rms_dbfs(pcm: np.ndarray) -> float:
+    """
+    Measure the RMS level of int16 PCM.
+
+    Args:
+        pcm: Mono int16 audio samples
+
+    Returns:
+        Level in dBFS (``-inf`` for digital silence)
+    """
+    samples = pcm16_to_float32(pcm)
+    mean_square = float(np.dot(samples, samples)) / max(samples.size, 1)
+    if mean_square <= 0:
+        return float("-inf")
+    return 10.0 * float(np.log10(mean_square))
+
+
+def split_at_silence(
+    pcm: np.ndarray,
+    sample_rate: int,
+    threshold_dbfs: float,
+    min_silence: float = 0.5,
+    max_duration: float = 10.0,
+) -> list[np.ndarray]:
+    """
+    Cut mono audio into speech segments at pauses.
+
+    Levels are measured over 30 ms frames. A segment ends once it has been
+    quiet (below ``threshold_dbfs``) for ``min_silence`` seconds, or when it
+    reaches ``max_duration``; segments that are quiet throughout are dropped.
+
+    Args:
+        pcm: Mono audio samples, int16 or float32 in [-1, 1]
+        sample_rate: Sample rate of the audio
+        threshold_dbfs: RMS level below which a frame counts as silence
+        min_silence: Pause length in seconds that ends a segment
+        max_duration: Longest segment in seconds
+
+    Returns:
+        Speech segments in order, as views into ``pcm``
+    """
+    frame = max(int(sample_rate * 0.03), 1)
+    n_frames = len(pcm) // frame
+    head = pcm[: n_frames * frame]
+    if head.dtype == np.int16:
+        samples = pcm16_to_float32(head)
+    else:
+        samples = head.astype(np.float32, copy=False)
+    frames = samples.reshape(n_frames, frame)
+    mean_square = np.einsum("ij,ij->i", frames, frames) / frame
+    voiced = (mean_square > 10.0 ** (threshold_dbfs / 10.0)).tolist()
+
+    silence_frames = max(int(min_silence / 0.03), 1)
+    max_frames = max(int(max_duration / 0.03), 1)
+    segments = []
+    start = 0
+    quiet = 0
+    has_voice = False
+    for i, is_voiced in enumerate(voiced):
+        if is_voiced:
+            quiet = 0
+            has_voice = True
+        else:
+            quiet += 1
+        if quiet >= silence_frames or i + 1 - start >= max_frames:
+            if has_voice:
+                segments.append(pcm[start * frame : (i + 1) * frame])
+            start = i + 1
+            quiet = 0
+            has_voice = False
+    if has_voice:
+        segments.append(pcm[start * frame :])
+    return segments
+
+
+def find_pause(
+    pcm: np.ndarray,
+    sample_rate: int,
+    threshold_dbfs: float,
+    min_silence: float = 0.2,
+) -> int | None:
+    """
+    Locate the first pause in mono audio.
+
+    Levels are measured over 30 ms frames, as in ``split_at_silence``.
+
+    Args:
+        pcm: Mono int16 audio samples
+        sample_rate: Sample rate of the audio
+        threshold_dbfs: RMS level below which a frame counts as silence
+        min_silence: Shortest quiet stretch in seconds that counts as a pause
+
+    Returns:
+        Sample offset of the middle of the first pause, or None if there is none
+    """
+    frame = max(int(sample_rate * 0.03), 1)
+    n_frames = len(pcm) // frame
+    silence_frames = max(int(min_silence / 0.03), 1)
+    if n_frames < silence_frames:
+        return None
+
+    frames = pcm16_to_float32(pcm[: n_frames * frame]).reshape(n_frames, frame)
+    mean_square = np.einsum("ij,ij->i", frames, frames) / frame
+    quiet = (mean_square <= 10.0 ** (threshold_dbfs / 10.0)).tolist()
+
+    run = 0
+    for i, is_quiet in enumerate(quiet):
+        run = run + 1 if is_quiet else 0
+        if run == silence_frames:
+            return (i + 1 - silence_frames // 2) * frame
+    return None
 
 
 class AudioChunker:
@@ -121,14 +313,9 @@ class AudioChunker:
         Returns:
             Path to temporary chunk file
         """
-        fd, temp_path = tempfile.mkstemp(
-            suffix=f"_chunk_{chunk_index}.wav", prefix="audio_chunk_"
+        return _write_temp_wav(
+            audio_data,
+            sample_rate,
+            suffix=f"_chunk_{chunk_index}.wav",
+            prefix="audio_chunk_",
         )
-        import os
-
-        os.close(fd)
-
-        # Save chunk
-        sf.write(temp_path, audio_data, sample_rate, subtype="PCM_16")
-
-        return temp_path
@@ -50,6 +50,14 @@ class Config(BaseSettings):
     asr_prompt: str = Field(
         default="Perform ASR.", description="System prompt for ASR task"
     )
+    silence_threshold_dbfs: float = Field(
+        default=-50.0,
+        description="Live chunks quieter than this RMS level skip transcription",
+    )
+    model_threads: int | None = Field(
+        default=None,
+        description="CPU threads per model run (None lets the binary decide)",
+    )
 
     # Text cleaner model settings
     text_cleaner_model_filename: str = Field(
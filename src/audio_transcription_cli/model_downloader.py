@@ -18,7 +18,7 @@ class ModelDownloader:
     REPO_URL = "https://huggingface.co/LiquidAI/LFM2-Audio-1.5B-GGUF"
     SUPPORTED_PLATFORMS = ["android-arm64", "macos-arm64", "ubuntu-arm64", "ubuntu-x64"]
 
-    def __init__(self, target_dir: str, quantization: str = "Q8_0"):
+    def __init__(self, target_dir: str, quantization: str = "Q8_0", warm_up: bool = True):
         self.target_dir = target_dir
         self.quantization = quantization
 
@@ -34,7 +34,8 @@ class ModelDownloader:
         self.llama_binary_name = "llama-lfm2-audio"
         self.asr_prompt = "Perform ASR."
 
-        self._warm_up_llama_cpp()
+        if warm_up:
+            self._warm_up_llama_cpp()
 
     @property
     def llama_cpp_binary_dir(self) -> Path:
@@ -100,17 +101,18 @@ class ModelDownloader:
         print("🎉 Download completed successfully!")
         return True
 
-    def get_model_command(self, audio_file_path: str) -> list[str]:
+    def get_model_command(self, audio_file_path: str, threads: int | None = None) -> list[str]:
         """
         Get command line arguments for llama-lfm2-audio.
 
         Args:
             audio_file_path: Path to input audio file
+            threads: CPU threads for the run (None keeps the binary's default)
 
         Returns:
             List of command arguments
         """
-        return [
+        cmd = [
             str(self.llama_cpp_binary_dir / self.llama_binary_name),
             "-m",
             str(self.model_path),
@@ -123,6 +125,9 @@ class ModelDownloader:
             "--audio",
             audio_file_path,
         ]
+        if threads:
+            cmd += ["-t", str(threads)]
+        return cmd
     
     def _validate_existing_download(self) -> bool:
         """Check if the target directory contains a valid download."""
@@ -256,6 +261,8 @@ class ModelDownloader:
         import tempfile
         import numpy as np
         import soundfile as sf
+
+        from .audio_preprocessing import TEMP_AUDIO_DIR
         
         try:
             print("🔥 Warming up llama.cpp model...")
@@ -266,7 +273,7 @@ class ModelDownloader:
             silence = np.zeros(int(sample_rate * duration), dtype=np.float32)
             
             # Create temporary file for warm-up audio
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
+            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False, dir=TEMP_AUDIO_DIR) as temp_file:
                 temp_audio_path = temp_file.name
                 
             # Write silent audio to temp file
@@ -45,9 +45,29 @@ class LFM2AudioWrapper:
         if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
+        return self._run_model(audio_path)
+
+    def _run_model(self, audio_path: str) -> str:
+        """
+        Run the model binary on a WAV file known to exist.
+
+        Used directly for temp files this wrapper has just written, which
+        need no existence check.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            RuntimeError: If transcription fails
+        """
         # Get command arguments
         # cmd = self.config.get_model_command(audio_path)
-        cmd = self.model_downloader.get_model_command(audio_path)
+        cmd = self.model_downloader.get_model_command(
+            audio_path, self.config.model_threads
+        )
 
         try:
             # Run the model from current working directory (not base_dir)
@@ -191,14 +211,11 @@ class LFM2AudioWrapper:
 
         try:
             # Transcribe the temporary file
-            transcription = self.transcribe_audio_file(temp_file)
+            transcription = self._run_model(temp_file)
             return transcription
         finally:
-            # Clean up temporary file
-            try:
-                os.unlink(temp_file)
-            except OSError:
-                pass  # File might already be deleted
+            # Clean up temporary file (it might already be deleted)
+            Path(temp_file).unlink(missing_ok=True)
 
     def test_model(self) -> bool:
         """
@@ -339,7 +356,7 @@ class LFM2AudioWrapper:
 
             # Process chunk
             # breakpoint()
-            chunk_transcription = self.transcribe_audio_file(chunk_path)
+            chunk_transcription = self._run_model(chunk_path)
 
             # Log incremental transcription if logger is available
             if raw_transcript_logger and chunk_transcription.strip():
@@ -391,7 +408,7 @@ class LFM2AudioWrapper:
 
         # Clean up chunk files
         for chunk_file in chunk_files_to_cleanup:
-            os.unlink(chunk_file)
+            Path(chunk_file).unlink(missing_ok=True)
 
         # Get final transcription from displayed parts or raw parts as fallback
         full_transcription = (